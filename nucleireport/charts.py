@@ -3,15 +3,21 @@
 from __future__ import annotations
 
 import io
-from typing import Optional
+import threading
+from functools import lru_cache
+from importlib import resources
+from typing import TYPE_CHECKING, Optional
 
-import matplotlib
-matplotlib.use("Agg")  # Non-interactive backend
-import matplotlib.pyplot as plt
-import matplotlib.ticker as ticker
+from PIL import Image
 
 from .styles import SEVERITY_COLORS
 
+# matplotlib is imported lazily: it is slow to import and only the
+# `generate` command ever draws a chart.
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
 
 # Matplotlib-compatible hex strings
 _COLORS = {
@@ -24,124 +30,229 @@ _COLORS = {
 
 SEVERITY_ORDER = ["critical", "high", "medium", "low", "info"]
 
+_LABELS = tuple(sev.upper() for sev in SEVERITY_ORDER)
+_COLOR_LIST = tuple(_COLORS[sev] for sev in SEVERITY_ORDER)
+
+# The PDF shows the charts smaller than their figure size, so 100 DPI
+# still lands around 150 effective DPI on the page; raise it for print.
+DEFAULT_DPI = 100
+
+# Charts are embedded in the PDF, never served, so trade a few KB of size
+# for a much cheaper deflate pass.
+_PNG_KWARGS = {"compress_level": 1, "optimize": False}
+
+
+# The bar and donut charts own separate figures and can be drawn from two
+# threads at once; the lock keeps two renders of one kind off one figure.
+_FIGURE_LOCKS = {"bar": threading.Lock(), "donut": threading.Lock()}
+
+
+@lru_cache(maxsize=None)
+def _get_figure(kind: str) -> Figure:
+    """Return the Agg-backed figure reused for every render of *kind*.
+
+    Creating a figure costs far more than clearing and redrawing its
+    axes, so each chart kind keeps one around. Callers must hold
+    ``_FIGURE_LOCKS[kind]``.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(facecolor="white")
+    FigureCanvasAgg(fig)
+    fig.add_subplot(111)
+    return fig
+
+
+def _reset_figure(fig: Figure, width: float, height: float, dpi: int) -> Axes:
+    """Clear a reused figure back to a blank state and return its axes."""
+    import matplotlib
+
+    fig.set_dpi(dpi)
+    fig.set_size_inches(width, height)
+    # Undo the previous tight_layout so every render lays out from scratch
+    fig.subplots_adjust(**{
+        side: matplotlib.rcParams[f"figure.subplot.{side}"]
+        for side in ("left", "right", "bottom", "top")
+    })
+    ax = fig.axes[0]
+    ax.clear()
+    return ax
+
+
+def _render_png(fig: Figure) -> bytes:
+    """Rasterize *fig* once and encode the Agg RGBA buffer straight to PNG.
+
+    Skips savefig's print_figure machinery (dpi/facecolor swapping, layout
+    re-runs, metadata) — the figure is already set up exactly as we want it.
+    """
+    canvas = fig.canvas
+    canvas.draw()
+    image = Image.frombuffer(
+        "RGBA", canvas.get_width_height(physical=True), canvas.buffer_rgba(),
+        "raw", "RGBA", 0, 1,
+    )
+    buf = io.BytesIO()
+    image.save(buf, format="png", **_PNG_KWARGS)
+    return buf.getvalue()
+
+
+# Pre-rendered charts for a report with no findings at the default size,
+# so such reports never import matplotlib. Regenerate them from
+# _bar_chart/_donut_chart with all-zero counts whenever the styling changes.
+_EMPTY_CHARTS = {
+    ("bar", 5.5, 2.5, DEFAULT_DPI): "empty_bar.png",
+    ("donut", 3.0, 3.0, DEFAULT_DPI): "empty_donut.png",
+}
+
+
+def _empty_chart(kind: str, width: float, height: float, dpi: int) -> Optional[bytes]:
+    """Return the pre-rendered empty chart for these settings, if there is one."""
+    name = _EMPTY_CHARTS.get((kind, width, height, dpi))
+    if name is None:
+        return None
+    return resources.files(__package__).joinpath("assets", name).read_bytes()
+
+
+def _count_key(severity_counts: dict[str, int]) -> tuple[int, ...]:
+    """Hashable cache key for a severity-count mapping."""
+    return tuple(severity_counts.get(sev, 0) for sev in SEVERITY_ORDER)
+
 
 def severity_bar_chart(
     severity_counts: dict[str, int],
     width: float = 5.5,
     height: float = 2.5,
+    dpi: int = DEFAULT_DPI,
 ) -> bytes:
     """Generate a horizontal bar chart of findings by severity.
 
     Returns PNG image bytes ready for embedding in a PDF.
     """
-    labels = []
-    counts = []
-    colors = []
+    counts = _count_key(severity_counts)
+    if not any(counts):
+        png = _empty_chart("bar", width, height, dpi)
+        if png is not None:
+            return png
+    return _bar_chart(counts, width, height, dpi)
 
-    for sev in SEVERITY_ORDER:
-        count = severity_counts.get(sev, 0)
-        labels.append(sev.upper())
-        counts.append(count)
-        colors.append(_COLORS[sev])
 
-    fig, ax = plt.subplots(figsize=(width, height))
-    fig.patch.set_facecolor("white")
+@lru_cache(maxsize=32)
+def _bar_chart(
+    counts: tuple[int, ...],
+    width: float,
+    height: float,
+    dpi: int,
+) -> bytes:
+    import matplotlib.ticker as ticker
 
-    bars = ax.barh(labels, counts, color=colors, height=0.6, edgecolor="white", linewidth=0.5)
+    with _FIGURE_LOCKS["bar"]:
+        fig = _get_figure("bar")
+        ax = _reset_figure(fig, width, height, dpi)
 
-    # Value labels on each bar
-    for bar, count in zip(bars, counts):
-        if count > 0:
-            ax.text(
-                bar.get_width() + 0.3,
-                bar.get_y() + bar.get_height() / 2,
-                str(count),
-                va="center",
-                ha="left",
-                fontsize=10,
-                fontweight="bold",
-                color="#334155",
-            )
-
-    # Styling
-    ax.set_xlim(0, max(counts) * 1.25 if max(counts) > 0 else 1)
-    ax.invert_yaxis()  # Critical on top
-    ax.xaxis.set_major_locator(ticker.MaxNLocator(integer=True))
-    ax.set_xlabel("Number of Findings", fontsize=9, color="#64748B")
-    ax.tick_params(axis="y", labelsize=10, colors="#334155")
-    ax.tick_params(axis="x", labelsize=8, colors="#94A3B8")
-
-    # Clean up spines
-    ax.spines["top"].set_visible(False)
-    ax.spines["right"].set_visible(False)
-    ax.spines["bottom"].set_color("#E2E8F0")
-    ax.spines["left"].set_visible(False)
-    ax.grid(axis="x", linestyle="--", alpha=0.3, color="#CBD5E1")
-
-    plt.tight_layout(pad=0.5)
+        bars = ax.barh(_LABELS, counts, color=_COLOR_LIST, height=0.6, edgecolor="white", linewidth=0.5)
 
-    buf = io.BytesIO()
-    fig.savefig(buf, format="png", dpi=150, bbox_inches="tight", facecolor="white")
-    plt.close(fig)
-    buf.seek(0)
-    return buf.read()
+        # Value labels on each bar
+        for bar, count in zip(bars, counts):
+            if count > 0:
+                ax.text(
+                    bar.get_width() + 0.3,
+                    bar.get_y() + bar.get_height() / 2,
+                    str(count),
+                    va="center",
+                    ha="left",
+                    fontsize=10,
+                    fontweight="bold",
+                    color="#334155",
+                )
+
+        # Styling
+        ax.set_xlim(0, max(counts) * 1.25 if max(counts) > 0 else 1)
+        ax.invert_yaxis()  # Critical on top
+        ax.xaxis.set_major_locator(ticker.MaxNLocator(integer=True))
+        ax.set_xlabel("Number of Findings", fontsize=9, color="#64748B")
+        ax.tick_params(axis="y", labelsize=10, colors="#334155")
+        ax.tick_params(axis="x", labelsize=8, colors="#94A3B8")
+
+        # Clean up spines
+        ax.spines["top"].set_visible(False)
+        ax.spines["right"].set_visible(False)
+        ax.spines["bottom"].set_color("#E2E8F0")
+        ax.spines["left"].set_visible(False)
+        ax.grid(axis="x", linestyle="--", alpha=0.3, color="#CBD5E1")
+
+        fig.tight_layout(pad=0.5)
+
+        return _render_png(fig)
 
 
 def severity_donut_chart(
     severity_counts: dict[str, int],
     width: float = 3.0,
     height: float = 3.0,
+    dpi: int = DEFAULT_DPI,
 ) -> bytes:
     """Generate a donut chart of findings by severity.
 
     Returns PNG image bytes ready for embedding in a PDF.
     """
+    counts = _count_key(severity_counts)
+    if not any(counts):
+        png = _empty_chart("donut", width, height, dpi)
+        if png is not None:
+            return png
+    return _donut_chart(counts, width, height, dpi)
+
+
+@lru_cache(maxsize=32)
+def _donut_chart(
+    count_key: tuple[int, ...],
+    width: float,
+    height: float,
+    dpi: int,
+) -> bytes:
     labels = []
     sizes = []
     colors = []
 
-    for sev in SEVERITY_ORDER:
-        count = severity_counts.get(sev, 0)
+    for label, color, count in zip(_LABELS, _COLOR_LIST, count_key):
         if count > 0:
-            labels.append(f"{sev.upper()}\n({count})")
+            labels.append(f"{label}\n({count})")
             sizes.append(count)
-            colors.append(_COLORS[sev])
+            colors.append(color)
 
     if not sizes:
         sizes = [1]
         colors = ["#E2E8F0"]
         labels = ["NO FINDINGS"]
 
-    fig, ax = plt.subplots(figsize=(width, height))
-    fig.patch.set_facecolor("white")
-
-    wedges, texts, autotexts = ax.pie(
-        sizes,
-        labels=labels,
-        colors=colors,
-        autopct=lambda pct: f"{pct:.0f}%" if pct > 5 else "",
-        startangle=90,
-        pctdistance=0.75,
-        wedgeprops=dict(width=0.4, edgecolor="white", linewidth=2),
-    )
+    with _FIGURE_LOCKS["donut"]:
+        fig = _get_figure("donut")
+        ax = _reset_figure(fig, width, height, dpi)
 
-    for text in texts:
-        text.set_fontsize(7)
-        text.set_color("#334155")
-    for autotext in autotexts:
-        autotext.set_fontsize(7)
-        autotext.set_color("white")
-        autotext.set_fontweight("bold")
+        wedges, texts, autotexts = ax.pie(
+            sizes,
+            labels=labels,
+            colors=colors,
+            autopct=lambda pct: f"{pct:.0f}%" if pct > 5 else "",
+            startangle=90,
+            pctdistance=0.75,
+            wedgeprops=dict(width=0.4, edgecolor="white", linewidth=2),
+        )
 
-    # Center label
-    total = sum(sizes)
-    ax.text(0, 0, f"{total}\nTotal", ha="center", va="center",
-            fontsize=14, fontweight="bold", color="#0F172A")
+        for text in texts:
+            text.set_fontsize(7)
+            text.set_color("#334155")
+        for autotext in autotexts:
+            autotext.set_fontsize(7)
+            autotext.set_color("white")
+            autotext.set_fontweight("bold")
 
-    plt.tight_layout(pad=0.2)
+        # Center label
+        total = sum(sizes)
+        ax.text(0, 0, f"{total}\nTotal", ha="center", va="center",
+                fontsize=14, fontweight="bold", color="#0F172A")
 
-    buf = io.BytesIO()
-    fig.savefig(buf, format="png", dpi=150, bbox_inches="tight", facecolor="white")
-    plt.close(fig)
-    buf.seek(0)
-    return buf.read()
+        fig.tight_layout(pad=0.2)
+
+        return _render_png(fig)
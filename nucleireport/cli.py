@@ -7,6 +7,7 @@ from pathlib import Path
 
 import click
 
+from .charts import DEFAULT_DPI
 from .models import Severity
 from .parser import parse_jsonl_file
 from .processor import process_findings
@@ -62,7 +63,9 @@ def main():
               default=None, help="Minimum severity to include (excludes lower).")
 @click.option("--logo", type=click.Path(exists=True), default=None,
               help="Company logo image to display on cover page (PNG/JPG).")
-def generate(input_file, output_file, title, min_severity, logo):
+@click.option("--chart-dpi", type=click.IntRange(min=50), default=DEFAULT_DPI, show_default=True,
+              help="Resolution of the chart images; raise it for print-quality output.")
+def generate(input_file, output_file, title, min_severity, logo, chart_dpi):
     """Generate a PDF report from Nuclei JSONL output."""
     click.echo(f"Reading {input_file}...")
     result = _parse_and_check(input_file)
@@ -82,7 +85,7 @@ def generate(input_file, output_file, title, min_severity, logo):
         click.echo(f"  Filtered to {min_severity}+ severity")
 
     click.echo("Generating PDF...")
-    out_path = generate_report(report, output_file)
+    out_path = generate_report(report, output_file, chart_dpi=chart_dpi)
     size_kb = out_path.stat().st_size / 1024
 
     click.secho(f"\nReport generated: {out_path}", fg="green", bold=True)
@@ -112,15 +115,9 @@ def validate(input_file):
     else:
         click.echo("No errors found.")
 
-    # Severity breakdown
-    counts: dict[str, int] = {}
-    for f in result.findings:
-        sev = f.info.severity.value
-        counts[sev] = counts.get(sev, 0) + 1
-
     click.echo("\nSeverity breakdown:")
     for sev in SEVERITY_CHOICES:
-        count = counts.get(sev, 0)
+        count = result.severity_counts[sev]
         click.echo(f"  {sev.upper():10s} {count}")
 
 
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from functools import cached_property
+from typing import Any, Mapping, Optional, Self
 
 from pydantic import BaseModel, Field, ConfigDict
 
@@ -18,19 +19,23 @@ class Severity(str, Enum):
 
     @property
     def sort_order(self) -> int:
-        return {
-            Severity.CRITICAL: 0,
-            Severity.HIGH: 1,
-            Severity.MEDIUM: 2,
-            Severity.LOW: 3,
-            Severity.INFO: 4,
-        }[self]
+        return _SEVERITY_SORT_ORDER[self]
+
+
+# Built once rather than on every sort_order lookup
+_SEVERITY_SORT_ORDER = {
+    Severity.CRITICAL: 0,
+    Severity.HIGH: 1,
+    Severity.MEDIUM: 2,
+    Severity.LOW: 3,
+    Severity.INFO: 4,
+}
 
 
 class NucleiClassification(BaseModel):
     """CVE/CWE/CVSS classification data for a finding."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     cve_id: Optional[list[str]] = Field(default=None, alias="cve-id")
     cwe_id: Optional[list[str]] = Field(default=None, alias="cwe-id")
@@ -41,7 +46,7 @@ class NucleiClassification(BaseModel):
 class NucleiInfo(BaseModel):
     """Metadata about the vulnerability from the Nuclei template."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     name: str
     author: Optional[list[str]] = None
@@ -56,7 +61,9 @@ class NucleiInfo(BaseModel):
 class NucleiFinding(BaseModel):
     """A single finding from Nuclei JSONL output (one per line)."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    # Frozen (with its nested models) so the cached properties below can
+    # never go stale.
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     template_id: str = Field(alias="template-id")
     template_url: Optional[str] = Field(default=None, alias="template-url")
@@ -70,18 +77,29 @@ class NucleiFinding(BaseModel):
     curl_command: Optional[str] = Field(default=None, alias="curl-command")
     matcher_status: bool = Field(alias="matcher-status")
 
-    @property
+    # Cached: the processor reads these repeatedly.
+    @cached_property
     def dedup_key(self) -> str:
         """Unique key for deduplication: same template + same host = one finding."""
         return f"{self.template_id}::{self.host}"
 
-    @property
+    @cached_property
     def cvss_score(self) -> float:
         """Convenience accessor for CVSS score, defaults to 0.0."""
         if self.info.classification and self.info.classification.cvss_score is not None:
             return self.info.classification.cvss_score
         return 0.0
 
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        """Copy the finding, dropping cached values an *update* may invalidate."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.__dict__.pop("dedup_key", None)
+            copied.__dict__.pop("cvss_score", None)
+        return copied
+
 
 class ScanReport(BaseModel):
     """Processed scan data ready for PDF rendering."""
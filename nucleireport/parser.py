@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import mmap
+import os
+import stat
 import sys
+from collections import Counter
 from pathlib import Path
-from typing import TextIO
+from typing import Iterable, TextIO
+
+from pydantic import ValidationError
 
 from .models import NucleiFinding
 
@@ -21,6 +26,7 @@ class ParseResult:
         self.total_lines: int = 0
         self.skipped_lines: int = 0
         self.errors: list[str] = []
+        self.severity_counts: Counter[str] = Counter()
 
     @property
     def success_count(self) -> int:
@@ -56,8 +62,15 @@ def parse_jsonl_file(path: str | Path) -> ParseResult:
     if not path.exists():
         raise FileNotFoundError(f"JSONL file not found: {path}")
 
-    with open(path, encoding="utf-8") as f:
-        return parse_jsonl_stream(f, source=str(path))
+    # Hand raw byte lines straight to pydantic-core, skipping the text
+    # layer's per-line UTF-8 decode. Only non-empty regular files can be
+    # mapped; pipes and FIFOs report size 0, so read those line by line.
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        if not (stat.S_ISREG(st.st_mode) and st.st_size > 0):
+            return _parse_lines(f, str(path))
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _parse_lines(iter(mm.readline, b""), str(path))
 
 
 def parse_jsonl_stream(stream: TextIO, source: str = "<stream>") -> ParseResult:
@@ -70,34 +83,42 @@ def parse_jsonl_stream(stream: TextIO, source: str = "<stream>") -> ParseResult:
     Returns:
         ParseResult with findings list and parse statistics.
     """
+    return _parse_lines(stream, source)
+
+
+def _parse_lines(lines: Iterable[str | bytes], source: str) -> ParseResult:
+    """Parse JSONL lines (text or UTF-8 bytes) into a ParseResult."""
     result = ParseResult()
 
-    for line_num, raw_line in enumerate(stream, 1):
+    for line_num, raw_line in enumerate(lines, 1):
         line = raw_line.strip()
         if not line:
             continue
 
         result.total_lines += 1
 
-        # Step 1: Parse JSON
+        # Decode + validate in one pass; pydantic-core reports malformed
+        # JSON as a json_invalid validation error.
         try:
-            data = json.loads(line)
-        except json.JSONDecodeError as e:
-            msg = f"{source} line {line_num}: invalid JSON — {e}"
-            logger.warning(msg)
-            result.errors.append(msg)
-            result.skipped_lines += 1
+            finding = NucleiFinding.model_validate_json(line)
+        except ValidationError as e:
+            first = e.errors()[0]
+            if first["type"] == "json_invalid":
+                msg = f"{source} line {line_num}: invalid JSON — {first['ctx']['error']}"
+            else:
+                msg = f"{source} line {line_num}: validation failed — {e}"
+            _skip_line(result, msg)
             continue
 
-        # Step 2: Validate into Pydantic model
-        try:
-            finding = NucleiFinding.model_validate(data)
-            result.findings.append(finding)
-        except Exception as e:
-            msg = f"{source} line {line_num}: validation failed — {e}"
-            logger.warning(msg)
-            result.errors.append(msg)
-            result.skipped_lines += 1
-            continue
+        result.findings.append(finding)
+        # Counted here so callers like `validate` need no second pass
+        result.severity_counts[finding.info.severity.value] += 1
 
     return result
+
+
+def _skip_line(result: ParseResult, msg: str) -> None:
+    """Record a line that could not be turned into a finding."""
+    logger.warning(msg)
+    result.errors.append(msg)
+    result.skipped_lines += 1
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import heapq
 from datetime import datetime
+from itertools import chain, islice
+from operator import attrgetter
 from typing import Optional
 
 from .models import NucleiFinding, ScanReport, Severity
@@ -16,17 +19,23 @@ SEVERITY_ORDER = [
     Severity.INFO,
 ]
 
+# Number of findings shown in the report's "top critical" section.
+TOP_CRITICAL_LIMIT = 5
+
 
 def deduplicate(findings: list[NucleiFinding]) -> list[NucleiFinding]:
     """Remove duplicate findings (same template-id + same host).
 
     Keeps the first occurrence of each unique finding.
     """
-    seen: dict[str, NucleiFinding] = {}
+    seen: set[str] = set()
+    unique: list[NucleiFinding] = []
     for f in findings:
-        if f.dedup_key not in seen:
-            seen[f.dedup_key] = f
-    return list(seen.values())
+        key = f.dedup_key
+        if key not in seen:
+            seen.add(key)
+            unique.append(f)
+    return unique
 
 
 def filter_by_min_severity(
@@ -46,27 +55,30 @@ def group_by_severity(
     findings: list[NucleiFinding],
 ) -> dict[str, list[NucleiFinding]]:
     """Group findings by severity level, sorted by CVSS score descending within each group."""
-    groups: dict[str, list[NucleiFinding]] = {s.value: [] for s in SEVERITY_ORDER}
+    groups = _empty_groups()
 
     for f in findings:
         groups[f.info.severity.value].append(f)
 
-    # Sort each group by CVSS score descending
-    for sev in groups:
-        groups[sev].sort(key=lambda f: f.cvss_score, reverse=True)
-
+    _sort_groups_by_cvss(groups)
     return groups
 
 
+def _empty_groups() -> dict[str, list[NucleiFinding]]:
+    """One empty list per severity level, in severity order."""
+    return {s.value: [] for s in SEVERITY_ORDER}
+
+
+def _sort_groups_by_cvss(groups: dict[str, list[NucleiFinding]]) -> None:
+    """Sort each severity group in place by CVSS score, descending."""
+    by_cvss = attrgetter("cvss_score")
+    for items in groups.values():
+        items.sort(key=by_cvss, reverse=True)
+
+
 def extract_targets(findings: list[NucleiFinding]) -> list[str]:
     """Extract unique host targets, preserving first-seen order."""
-    seen: set[str] = set()
-    targets: list[str] = []
-    for f in findings:
-        if f.host not in seen:
-            seen.add(f.host)
-            targets.append(f.host)
-    return targets
+    return list(dict.fromkeys(f.host for f in findings))
 
 
 def extract_time_range(findings: list[NucleiFinding]) -> tuple[str, str]:
@@ -79,17 +91,18 @@ def extract_time_range(findings: list[NucleiFinding]) -> tuple[str, str]:
 
 def extract_top_critical(
     findings: list[NucleiFinding],
-    limit: int = 5,
+    limit: int = TOP_CRITICAL_LIMIT,
 ) -> list[NucleiFinding]:
     """Extract the top N most severe findings across all severity levels.
 
     Sorted by: severity (critical first), then CVSS score descending.
     """
-    sorted_findings = sorted(
+    # O(n log limit) instead of sorting everything to keep a handful
+    return heapq.nsmallest(
+        limit,
         findings,
         key=lambda f: (f.info.severity.sort_order, -f.cvss_score),
     )
-    return sorted_findings[:limit]
 
 
 def process_findings(
@@ -109,22 +122,58 @@ def process_findings(
     Returns:
         ScanReport with all processed data.
     """
-    if dedup:
-        findings = deduplicate(findings)
-
-    if min_severity is not None:
-        findings = filter_by_min_severity(findings, min_severity)
+    # Single pass doing the work of deduplicate, filter_by_min_severity,
+    # group_by_severity, extract_targets and extract_time_range. The rules
+    # are inlined here because a per-finding function call would slow down
+    # both this loop and the helpers; test_matches_individual_steps keeps
+    # the two in agreement.
+    threshold = min_severity.sort_order if min_severity is not None else None
+    seen_keys: set[str] = set()
+    hosts: dict[str, None] = {}  # insertion-ordered set
+    grouped = _empty_groups()
+    earliest = latest = ""
+    total = 0
 
-    grouped = group_by_severity(findings)
+    for f in findings:
+        if dedup:
+            key = f.dedup_key
+            if key in seen_keys:
+                continue
+            seen_keys.add(key)
+
+        severity = f.info.severity
+        if threshold is not None and severity.sort_order > threshold:
+            continue
+
+        grouped[severity.value].append(f)
+
+        hosts[f.host] = None
+
+        ts = f.timestamp
+        if total == 0:
+            earliest = latest = ts
+        elif ts < earliest:
+            earliest = ts
+        elif ts > latest:
+            latest = ts
+        total += 1
+
+    _sort_groups_by_cvss(grouped)
     severity_counts = {sev: len(items) for sev, items in grouped.items()}
 
+    # Groups are already in severity order and sorted by CVSS within each,
+    # so their concatenation is exactly what extract_top_critical returns.
+    top_critical = list(
+        islice(chain.from_iterable(grouped.values()), TOP_CRITICAL_LIMIT)
+    )
+
     return ScanReport(
         title=title,
         generated_at=datetime.now(),
-        total_findings=len(findings),
-        targets=extract_targets(findings),
+        total_findings=total,
+        targets=list(hosts),
         severity_counts=severity_counts,
         findings_by_severity=grouped,
-        top_critical=extract_top_critical(findings),
-        scan_time_range=extract_time_range(findings),
+        top_critical=top_critical,
+        scan_time_range=(earliest, latest),
     )
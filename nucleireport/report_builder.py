@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import io
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from xml.sax.saxutils import escape
 
@@ -24,7 +25,7 @@ from reportlab.platypus import (
 )
 
 from .models import NucleiFinding, ScanReport, Severity
-from .charts import severity_bar_chart, severity_donut_chart
+from .charts import DEFAULT_DPI, severity_bar_chart, severity_donut_chart
 from .styles import (
     PAGE_SIZE,
     PAGE_WIDTH,
@@ -53,9 +54,15 @@ def _esc(text: str | None) -> str:
 class ReportBuilder:
     """Builds a multi-page PDF vulnerability assessment report."""
 
-    def __init__(self, report: ScanReport, output_path: str | Path) -> None:
+    def __init__(
+        self,
+        report: ScanReport,
+        output_path: str | Path,
+        chart_dpi: int = DEFAULT_DPI,
+    ) -> None:
         self.report = report
         self.output_path = Path(output_path)
+        self.chart_dpi = chart_dpi
         self.styles = get_styles()
         self.story: list = []
 
@@ -235,8 +242,13 @@ class ReportBuilder:
         self.story.append(Spacer(1, 16))
 
         # --- Charts side by side: bar chart + donut chart ---
-        bar_png = severity_bar_chart(self.report.severity_counts)
-        donut_png = severity_donut_chart(self.report.severity_counts)
+        # The two charts use separate figures, so render them concurrently
+        counts = self.report.severity_counts
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            bar_future = pool.submit(severity_bar_chart, counts, dpi=self.chart_dpi)
+            donut_future = pool.submit(severity_donut_chart, counts, dpi=self.chart_dpi)
+            bar_png = bar_future.result()
+            donut_png = donut_future.result()
 
         bar_img = Image(io.BytesIO(bar_png), width=3.6 * inch, height=1.7 * inch)
         donut_img = Image(io.BytesIO(donut_png), width=2.2 * inch, height=2.2 * inch)
@@ -644,15 +656,20 @@ class ReportBuilder:
         self.story.append(ref_table)
 
 
-def generate_report(report: ScanReport, output_path: str | Path) -> Path:
+def generate_report(
+    report: ScanReport,
+    output_path: str | Path,
+    chart_dpi: int = DEFAULT_DPI,
+) -> Path:
     """Convenience function to generate a PDF report.
 
     Args:
         report: Processed ScanReport from the processor.
         output_path: Where to write the PDF file.
+        chart_dpi: Resolution of the embedded chart images.
 
     Returns:
         Path to the generated PDF.
     """
-    builder = ReportBuilder(report, output_path)
+    builder = ReportBuilder(report, output_path, chart_dpi=chart_dpi)
     return builder.build()
@@ -0,0 +1,60 @@
+"""Shared pytest fixtures."""
+
+import pickle
+import sys
+from pathlib import Path
+
+import pydantic
+import pytest
+
+from nucleireport import models, parser
+from nucleireport.parser import ParseResult, parse_jsonl_file
+
+
+SAMPLE_DATA = Path(__file__).parent.parent / "sample_data" / "sample_scan.jsonl"
+
+_CACHE_KEY = "nucleireport/sample_scan_key"
+
+
+def _stat_key(*paths: Path) -> list[int]:
+    """Cheap change detector: mtime and size of each path."""
+    key = []
+    for path in paths:
+        st = path.stat()
+        key += [st.st_mtime_ns, st.st_size]
+    return key
+
+
+@pytest.fixture(scope="session")
+def sample_data_path() -> Path:
+    """Path to the bundled sample Nuclei scan."""
+    return SAMPLE_DATA
+
+
+@pytest.fixture(scope="session")
+def sample_parse_result(request) -> ParseResult:
+    """The sample scan, parsed once and pickled across test runs.
+
+    The pickle is reused while the sample file, parser, models, pydantic
+    version and Python version are unchanged. Shared across tests — treat it as read-only.
+    """
+    cache = getattr(request.config, "cache", None)  # None with -p no:cacheprovider
+    if cache is None:
+        return parse_jsonl_file(SAMPLE_DATA)
+
+    key = [
+        *_stat_key(SAMPLE_DATA, Path(parser.__file__), Path(models.__file__)),
+        pydantic.VERSION,
+        *sys.version_info[:2],
+    ]
+    pickled = cache.mkdir("nucleireport") / "sample_scan.pkl"
+    if cache.get(_CACHE_KEY, None) == key and pickled.exists():
+        try:
+            return pickle.loads(pickled.read_bytes())
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            pass  # stale or corrupt — fall through and re-parse
+
+    result = parse_jsonl_file(SAMPLE_DATA)
+    pickled.write_bytes(pickle.dumps(result))
+    cache.set(_CACHE_KEY, key)
+    return result
@@ -0,0 +1,75 @@
+"""Tests for chart generation."""
+
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from PIL import Image, ImageChops, ImageStat
+
+from nucleireport import charts
+from nucleireport.charts import severity_bar_chart, severity_donut_chart
+
+
+COUNTS = {"critical": 5, "high": 8, "medium": 6, "low": 4, "info": 3}
+
+# Mean per-channel RMS (0-255) tolerated between a stored asset and a fresh
+# render.
+MAX_ASSET_RMS = 2.0
+
+
+def _size(png: bytes) -> tuple[int, int]:
+    return Image.open(io.BytesIO(png)).size
+
+
+class TestSeverityCharts:
+    def test_bar_chart_is_png_at_requested_dpi(self):
+        png = severity_bar_chart(COUNTS, width=5.5, height=2.5, dpi=100)
+        assert png.startswith(b"\x89PNG")
+        assert _size(png) == (550, 250)
+
+    def test_donut_chart_is_png_at_requested_dpi(self):
+        png = severity_donut_chart(COUNTS, width=3.0, height=3.0, dpi=100)
+        assert png.startswith(b"\x89PNG")
+        assert _size(png) == (300, 300)
+
+    def test_repeat_render_is_cached(self):
+        assert severity_bar_chart(COUNTS) is severity_bar_chart(dict(COUNTS))
+
+    def test_concurrent_renders_match_sequential(self):
+        jobs = [
+            (chart, {"high": n, "low": n + 1}, 2.0 + n / 10)
+            for n in range(1, 6)
+            for chart in (severity_bar_chart, severity_donut_chart)
+        ]
+        expected = [chart(counts, width=w) for chart, counts, w in jobs]
+        charts._bar_chart.cache_clear()
+        charts._donut_chart.cache_clear()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda job: job[0](job[1], width=job[2]), jobs))
+        assert results == expected
+
+
+class TestEmptyCharts:
+    def test_uses_prerendered_assets(self):
+        assets = charts.resources.files("nucleireport") / "assets"
+        assert severity_bar_chart({}) == (assets / "empty_bar.png").read_bytes()
+        assert severity_donut_chart({}) == (assets / "empty_donut.png").read_bytes()
+
+    @pytest.mark.parametrize("chart, render, size", [
+        (severity_bar_chart, charts._bar_chart, (5.5, 2.5)),
+        (severity_donut_chart, charts._donut_chart, (3.0, 3.0)),
+    ])
+    def test_assets_match_rendered_chart(self, chart, render, size):
+        asset = Image.open(io.BytesIO(chart({})))
+        rendered = Image.open(io.BytesIO(render((0,) * 5, *size, charts.DEFAULT_DPI)))
+        assert (asset.size, asset.mode) == (rendered.size, rendered.mode)
+
+        # Text rendering varies with the matplotlib/FreeType build, so allow
+        # small differences; a stale asset differs by far more.
+        diff = ImageChops.difference(rendered.convert("RGBA"), asset.convert("RGBA"))
+        rms = ImageStat.Stat(diff).rms
+        assert sum(rms) / len(rms) < MAX_ASSET_RMS
+
+    def test_non_default_size_still_renders(self):
+        png = severity_bar_chart({}, width=4.0, height=2.0, dpi=100)
+        assert _size(png) == (400, 200)
@@ -2,14 +2,13 @@
 
 import io
 import json
+import os
+import threading
 import pytest
-from pathlib import Path
 
 from nucleireport.parser import parse_jsonl_file, parse_jsonl_stream
 
 
-SAMPLE_DATA = Path(__file__).parent.parent / "sample_data" / "sample_scan.jsonl"
-
 VALID_LINE = json.dumps({
     "template-id": "test-vuln-001",
     "info": {
@@ -61,6 +60,23 @@ class TestParseJsonlStream:
         assert result.skipped_lines == 1
         assert "validation failed" in result.errors[0]
 
+    def test_invalid_model_reported_against_its_line(self):
+        bad_data = json.dumps({"foo": "bar"})
+        lines = "\n".join([VALID_LINE, VALID_LINE, bad_data, VALID_LINE]) + "\n"
+        result = parse_jsonl_stream(io.StringIO(lines), source="scan.jsonl")
+        assert result.success_count == 3
+        assert result.skipped_lines == 1
+        assert result.errors[0].startswith("scan.jsonl line 3:")
+
+    def test_each_line_parsed_on_its_own(self):
+        """Lines that only form valid JSON together are still rejected."""
+        head, tail = VALID_LINE.split(", ", 1)
+        lines = [VALID_LINE + "," + VALID_LINE, head, tail]
+        result = parse_jsonl_stream(io.StringIO("\n".join(lines) + "\n"))
+        assert result.success_count == 0
+        assert result.skipped_lines == 3
+        assert all("invalid JSON" in err for err in result.errors)
+
     def test_multiple_valid_lines(self):
         lines = "\n".join([VALID_LINE] * 5) + "\n"
         stream = io.StringIO(lines)
@@ -97,8 +113,8 @@ class TestParseJsonlStream:
 
 
 class TestParseJsonlFile:
-    def test_sample_data_parses(self):
-        result = parse_jsonl_file(SAMPLE_DATA)
+    def test_sample_data_parses(self, sample_data_path):
+        result = parse_jsonl_file(sample_data_path)
         assert result.success_count == 26
         assert result.skipped_lines == 0
 
@@ -106,7 +122,40 @@ class TestParseJsonlFile:
         with pytest.raises(FileNotFoundError):
             parse_jsonl_file("/nonexistent/path.jsonl")
 
-    def test_all_severities_present(self):
-        result = parse_jsonl_file(SAMPLE_DATA)
-        severities = {f.info.severity.value for f in result.findings}
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.jsonl"
+        path.write_bytes(b"")
+        result = parse_jsonl_file(path)
+        assert result.total_lines == 0
+        assert result.success_count == 0
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs os.mkfifo")
+    def test_fifo(self, tmp_path):
+        fifo = tmp_path / "scan.fifo"
+        os.mkfifo(fifo)
+        writer = threading.Thread(
+            target=lambda: fifo.write_text(VALID_LINE + "\n" + VALID_LINE + "\n")
+        )
+        writer.start()
+        result = parse_jsonl_file(fifo)
+        writer.join()
+        assert result.success_count == 2
+        assert result.skipped_lines == 0
+
+    def test_invalid_utf8_line_skipped(self, tmp_path):
+        path = tmp_path / "scan.jsonl"
+        path.write_bytes(b"\xff\xfe{}\r\n" + VALID_LINE.encode() + b"\r\n")
+        result = parse_jsonl_file(path)
+        assert result.success_count == 1
+        assert result.skipped_lines == 1
+        assert "invalid JSON" in result.errors[0]
+
+    def test_all_severities_present(self, sample_parse_result):
+        severities = {f.info.severity.value for f in sample_parse_result.findings}
         assert severities == {"critical", "high", "medium", "low", "info"}
+
+    def test_severity_counts(self, sample_parse_result):
+        result = sample_parse_result
+        assert sum(result.severity_counts.values()) == result.success_count
+        assert result.severity_counts["critical"] == 5
+        assert result.severity_counts["high"] == 8
@@ -1,9 +1,16 @@
 """Tests for the data processor."""
 
+import functools
 import json
 import pytest
+from pydantic import ValidationError
 
-from nucleireport.models import NucleiFinding, Severity
+from nucleireport.models import (
+    NucleiClassification,
+    NucleiFinding,
+    NucleiInfo,
+    Severity,
+)
 from nucleireport.processor import (
     deduplicate,
     filter_by_min_severity,
@@ -13,11 +20,6 @@ from nucleireport.processor import (
     extract_top_critical,
     process_findings,
 )
-from nucleireport.parser import parse_jsonl_file
-from pathlib import Path
-
-
-SAMPLE_DATA = Path(__file__).parent.parent / "sample_data" / "sample_scan.jsonl"
 
 
 def _make_finding(
@@ -27,22 +29,41 @@ def _make_finding(
     cvss_score: float | None = None,
     timestamp: str = "2025-02-10T12:00:00-05:00",
 ) -> NucleiFinding:
-    """Helper to create a NucleiFinding for testing."""
-    data = {
-        "template-id": template_id,
-        "info": {
-            "name": f"Test {template_id}",
-            "severity": severity,
-        },
-        "type": "http",
-        "host": host,
-        "matched-at": f"{host}/test",
-        "timestamp": timestamp,
-        "matcher-status": True,
-    }
+    """Helper to create a NucleiFinding for testing.
+
+    Identical arguments return the same (cached) instance; tests only
+    read findings, so sharing them is safe.
+    """
+    return _build_finding(template_id, host, severity, cvss_score, timestamp)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_finding(
+    template_id: str,
+    host: str,
+    severity: str,
+    cvss_score: float | None,
+    timestamp: str,
+) -> NucleiFinding:
+    # model_construct skips validation: these inputs are known-good, and
+    # TestFindingModel covers the validating path.
+    extra = {}
     if cvss_score is not None:
-        data["info"]["classification"] = {"cvss-score": cvss_score}
-    return NucleiFinding.model_validate(data)
+        extra["classification"] = NucleiClassification.model_construct(cvss_score=cvss_score)
+    info = NucleiInfo.model_construct(
+        name=f"Test {template_id}",
+        severity=Severity(severity),
+        **extra,
+    )
+    return NucleiFinding.model_construct(
+        template_id=template_id,
+        info=info,
+        type="http",
+        host=host,
+        matched_at=f"{host}/test",
+        timestamp=timestamp,
+        matcher_status=True,
+    )
 
 
 class TestDeduplicate:
@@ -68,56 +89,81 @@ class TestDeduplicate:
         ]
         assert len(deduplicate(findings)) == 2
 
-    def test_empty_list(self):
-        assert deduplicate([]) == []
 
+class TestFindingModel:
+    def test_validation_accepts_real_payload(self):
+        data = {
+            "template-id": "test-001",
+            "info": {
+                "name": "Test test-001",
+                "severity": "high",
+                "classification": {"cvss-score": 7.5},
+            },
+            "type": "http",
+            "host": "https://example.com",
+            "matched-at": "https://example.com/test",
+            "timestamp": "2025-02-10T12:00:00-05:00",
+            "matcher-status": True,
+        }
+        finding = NucleiFinding.model_validate(data)
+        assert finding == _make_finding(cvss_score=7.5)
+        assert finding.info.severity is Severity.HIGH
+        assert finding.cvss_score == 7.5
+        assert finding.dedup_key == "test-001::https://example.com"
+
+    def test_findings_are_immutable(self):
+        finding = _make_finding(template_id="frozen")
+        with pytest.raises(ValidationError):
+            finding.host = "https://other.com"
+
+    def test_copy_with_update_recomputes_cached_values(self):
+        finding = _make_finding(template_id="copy", cvss_score=5.0)
+        assert finding.dedup_key == "copy::https://example.com"
+        assert finding.cvss_score == 5.0
+
+        moved = finding.model_copy(update={"host": "https://other.com"})
+        assert moved.dedup_key == "copy::https://other.com"
+        rescored = finding.model_copy(update={"info": _make_finding(cvss_score=9.0).info})
+        assert rescored.cvss_score == 9.0
+
+
+SEVERITIES = ("critical", "high", "medium", "low", "info")
+
+
+@pytest.fixture(scope="class")
+def all_severity_findings() -> list[NucleiFinding]:
+    """One finding per severity level, shared by a test class."""
+    return [_make_finding(severity=sev) for sev in SEVERITIES]
+
+
+@pytest.fixture(scope="class")
+def scored_findings() -> list[NucleiFinding]:
+    """One finding per severity level, each with a CVSS score."""
+    scores = (10.0, 8.0, 5.0, 3.0, 0.0)
+    return [
+        _make_finding(severity=sev, cvss_score=score)
+        for sev, score in zip(SEVERITIES, scores)
+    ]
 
-class TestFilterBySeverity:
-    def test_filter_medium_and_above(self):
-        findings = [
-            _make_finding(severity="critical"),
-            _make_finding(severity="high"),
-            _make_finding(severity="medium"),
-            _make_finding(severity="low"),
-            _make_finding(severity="info"),
-        ]
-        filtered = filter_by_min_severity(findings, Severity.MEDIUM)
-        severities = {f.info.severity.value for f in filtered}
-        assert severities == {"critical", "high", "medium"}
-
-    def test_filter_critical_only(self):
-        findings = [
-            _make_finding(severity="critical"),
-            _make_finding(severity="high"),
-        ]
-        filtered = filter_by_min_severity(findings, Severity.CRITICAL)
-        assert len(filtered) == 1
-        assert filtered[0].info.severity == Severity.CRITICAL
 
-    def test_filter_info_keeps_all(self):
-        findings = [
-            _make_finding(severity="critical"),
-            _make_finding(severity="info"),
-        ]
-        filtered = filter_by_min_severity(findings, Severity.INFO)
-        assert len(filtered) == 2
+class TestFilterBySeverity:
+    @pytest.mark.parametrize("min_severity, expected", [
+        (Severity.CRITICAL, {"critical"}),
+        (Severity.MEDIUM, {"critical", "high", "medium"}),
+        (Severity.INFO, set(SEVERITIES)),
+    ])
+    def test_filter_threshold(self, all_severity_findings, min_severity, expected):
+        filtered = filter_by_min_severity(all_severity_findings, min_severity)
+        assert len(filtered) == len(expected)
+        assert {f.info.severity.value for f in filtered} == expected
 
 
 class TestGroupBySeverity:
-    def test_groups_correctly(self):
-        findings = [
-            _make_finding(severity="critical", cvss_score=10.0),
-            _make_finding(severity="high", cvss_score=8.0),
-            _make_finding(severity="medium", cvss_score=5.0),
-            _make_finding(severity="low", cvss_score=3.0),
-            _make_finding(severity="info", cvss_score=0.0),
-        ]
-        groups = group_by_severity(findings)
-        assert len(groups["critical"]) == 1
-        assert len(groups["high"]) == 1
-        assert len(groups["medium"]) == 1
-        assert len(groups["low"]) == 1
-        assert len(groups["info"]) == 1
+    @pytest.mark.parametrize("severity", SEVERITIES)
+    def test_groups_correctly(self, scored_findings, severity):
+        groups = group_by_severity(scored_findings)
+        assert len(groups[severity]) == 1
+        assert groups[severity][0].info.severity.value == severity
 
     def test_sorted_by_cvss_within_group(self):
         findings = [
@@ -145,9 +191,7 @@ class TestExtractTargets:
         ]
         targets = extract_targets(findings)
         assert targets == ["https://b.com", "https://a.com", "https://c.com"]
-
-    def test_empty(self):
-        assert extract_targets([]) == []
+        assert targets == list(dict.fromkeys(f.host for f in findings))
 
 
 class TestExtractTimeRange:
@@ -161,9 +205,6 @@ class TestExtractTimeRange:
         assert "12:00:00" in earliest
         assert "16:00:00" in latest
 
-    def test_empty(self):
-        assert extract_time_range([]) == ("", "")
-
 
 class TestExtractTopCritical:
     def test_top_5_by_severity_then_cvss(self):
@@ -183,15 +224,23 @@ class TestExtractTopCritical:
         assert top[2].info.severity == Severity.HIGH
         assert top[4].info.severity == Severity.MEDIUM
 
-    def test_fewer_than_limit(self):
-        findings = [_make_finding(severity="high")]
-        assert len(extract_top_critical(findings, limit=5)) == 1
+
+@pytest.mark.parametrize("fn, args, expected", [
+    (deduplicate, ([],), []),
+    (filter_by_min_severity, ([], Severity.INFO), []),
+    (extract_targets, ([],), []),
+    (extract_time_range, ([],), ("", "")),
+    (extract_top_critical, ([],), []),
+    # Fewer findings than the limit: return what there is
+    (extract_top_critical, ([_make_finding()], 5), [_make_finding()]),
+])
+def test_small_inputs(fn, args, expected):
+    assert fn(*args) == expected
 
 
 class TestProcessFindings:
-    def test_full_pipeline_with_sample_data(self):
-        result = parse_jsonl_file(SAMPLE_DATA)
-        report = process_findings(result.findings)
+    def test_full_pipeline_with_sample_data(self, sample_parse_result):
+        report = process_findings(sample_parse_result.findings)
 
         assert report.total_findings == 26
         assert report.severity_counts["critical"] == 5
@@ -220,6 +269,18 @@ class TestProcessFindings:
         assert report.severity_counts["low"] == 0
         assert report.severity_counts["info"] == 0
 
+    def test_matches_individual_steps(self, sample_parse_result):
+        findings = sample_parse_result.findings
+        findings = findings + findings[:4]  # a few duplicates
+        report = process_findings(findings, min_severity=Severity.LOW)
+
+        expected = filter_by_min_severity(deduplicate(findings), Severity.LOW)
+        assert report.total_findings == len(expected)
+        assert report.findings_by_severity == group_by_severity(expected)
+        assert report.targets == extract_targets(expected)
+        assert report.scan_time_range == extract_time_range(expected)
+        assert report.top_critical == extract_top_critical(expected)
+
     def test_custom_title(self):
         report = process_findings([], title="Custom Report")
         assert report.title == "Custom Report"